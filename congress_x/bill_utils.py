@@ -0,0 +1,38 @@
+# Bill Utilities
+# Helpers shared by the image generator and the poster
+
+from datetime import datetime, timezone, timedelta
+
+try:
+    from zoneinfo import ZoneInfo
+    EST_TZ = ZoneInfo("America/New_York")  # US Eastern, DST-aware
+except Exception:
+    EST_TZ = timezone(timedelta(hours=-5), "EST")  # No tz database available: fixed EST (UTC-5)
+
+
+def now_est_strings() -> tuple:
+    """
+    Get the current Eastern date and 12-hour time as display strings.
+
+    Returns:
+        Tuple of (date as YYYY-MM-DD, time as HH:MM AM/PM plus zone, e.g. EST or EDT)
+    """
+    now = datetime.now(EST_TZ)
+    return now.date().isoformat(), f"{now.hour % 12 or 12:02d}:{now.minute:02d} {'AM' if now.hour < 12 else 'PM'} {now.tzname()}"
+
+
+def dedupe_by_bill_number(bills: list) -> list:
+    """
+    Drop repeated bills by formatted_bill_number in one pass, keeping first occurrences in order.
+    Bills without a number are keyed by identity, so every one of them is kept in place.
+
+    Args:
+        bills: List of bill data dictionaries
+
+    Returns:
+        Deduplicated list of bill data dictionaries
+    """
+    unique_bills = {}
+    for bill in bills:
+        unique_bills.setdefault(bill.get('formatted_bill_number') or id(bill), bill)
+    return list(unique_bills.values())
@@ -5,7 +5,7 @@ import logging
 import os
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
 import requests
@@ -67,15 +67,15 @@ def get_dynamic_start_number(bill_type: str, fallback_start: int) -> int:
             # Start 300 numbers higher than the highest in database to catch new bills
             # (This handles cases where many bills are introduced in a session)
             dynamic_start = highest_db_bill + 300
-            LOG.info(f"Using dynamic start for {bill_type} bills: {dynamic_start} (highest in DB: {highest_db_bill})")
+            LOG.info("Using dynamic start for %s bills: %s (highest in DB: %s)", bill_type, dynamic_start, highest_db_bill)
             return dynamic_start
         else:
-            LOG.info(f"No {bill_type} bills found in database, using fallback start: {fallback_start}")
+            LOG.info("No %s bills found in database, using fallback start: %s", bill_type, fallback_start)
             return fallback_start
 
     except Exception as e:
-        LOG.warning(f"Could not determine dynamic start number for {bill_type}: {e}")
-        LOG.info(f"Using fallback start: {fallback_start}")
+        LOG.warning("Could not determine dynamic start number for %s: %s", bill_type, e)
+        LOG.info("Using fallback start: %s", fallback_start)
         return fallback_start
 
 
@@ -93,8 +93,6 @@ def fetch_recent_bills(api_key: str, limit: int = 250, days_back: int = 7) -> Li
         List of bill dictionaries from the 119th Congress introduced in the date range,
         sorted with HR bills first (descending by number), then other bills.
     """
-    from datetime import datetime, timedelta
-
     # Calculate date range
     today = datetime.now().date()
     from_date = today - timedelta(days=days_back)
@@ -104,7 +102,7 @@ def fetch_recent_bills(api_key: str, limit: int = 250, days_back: int = 7) -> Li
     session.headers.update({"X-Api-Key": api_key})
 
     try:
-        LOG.info(f"Fetching bills from 119th Congress introduced between {from_date} and {today}...")
+        LOG.info("Fetching bills from 119th Congress introduced between %s and %s...", from_date, today)
 
         all_bills = []
 
@@ -145,32 +143,32 @@ def fetch_recent_bills(api_key: str, limit: int = 250, days_back: int = 7) -> Li
                                 all_bills.append(bill_data)
                                 hr_bills_found += 1
                                 consecutive_not_found = 0  # Reset counter
-                                LOG.debug(f"Found recent HR bill: {bill_type.upper()}.{bill_num} introduced on {introduced_date} (via {intro_action.get('type')} action)")
+                                LOG.debug("Found recent HR bill: %s.%s introduced on %s (via %s action)", bill_type.upper(), bill_num, introduced_date, intro_action.get('type'))
                             elif introduced_date < from_date:
                                 # Bill is too old, we can stop going backwards
-                                LOG.debug(f"Bill {bill_type.upper()}.{bill_num} is too old ({introduced_date}), stopping HR search")
+                                LOG.debug("Bill %s.%s is too old (%s), stopping HR search", bill_type.upper(), bill_num, introduced_date)
                                 break
                         except (ValueError, TypeError) as e:
-                            LOG.debug(f"Could not parse date for {bill_type.upper()}.{bill_num}: {e}")
+                            LOG.debug("Could not parse date for %s.%s: %s", bill_type.upper(), bill_num, e)
                     else:
                         # Bill has no intro action - log but continue searching (don't count against consecutive_not_found)
-                        LOG.debug(f"Bill {bill_type.upper()}.{bill_num} has no IntroReferral action, continuing search")
+                        LOG.debug("Bill %s.%s has no IntroReferral action, continuing search", bill_type.upper(), bill_num)
                 else:
                     # Bill details not found - this could be a bill that doesn't exist yet
                     # Don't count this as consecutive_not_found, just skip and continue
-                    LOG.debug(f"Bill {bill_type.upper()}.{bill_num} not found (may not exist yet), continuing search")
+                    LOG.debug("Bill %s.%s not found (may not exist yet), continuing search", bill_type.upper(), bill_num)
                     continue
             except Exception as e:
                 # Check if it's a 404 (bill doesn't exist) - this is expected when searching high numbers
                 if "404" in str(e):
-                    LOG.debug(f"Bill {bill_type.upper()}.{bill_num} does not exist (404), continuing search")
+                    LOG.debug("Bill %s.%s does not exist (404), continuing search", bill_type.upper(), bill_num)
                     continue
                 else:
                     # Other error - log as warning and count as consecutive not found
-                    LOG.warning(f"Error checking HR bill {bill_num}: {e}")
+                    LOG.warning("Error checking HR bill %s: %s", bill_num, e)
                     consecutive_not_found += 1
                     if consecutive_not_found >= max_consecutive_not_found:
-                        LOG.debug(f"Found {max_consecutive_not_found} consecutive errors, stopping HR search")
+                        LOG.debug("Found %s consecutive errors, stopping HR search", max_consecutive_not_found)
                         break
 
         # Check Senate bills (S.*) - use efficient search
@@ -218,28 +216,28 @@ def fetch_recent_bills(api_key: str, limit: int = 250, days_back: int = 7) -> Li
                                     all_bills.append(bill_data)
                                     senate_bills_found += 1
                                     consecutive_not_found = 0
-                                    LOG.debug(f"Found recent Senate bill: {bill_type.upper()}.{bill_num} introduced on {introduced_date} (via {intro_action.get('type')} action)")
+                                    LOG.debug("Found recent Senate bill: %s.%s introduced on %s (via %s action)", bill_type.upper(), bill_num, introduced_date, intro_action.get('type'))
                                 elif introduced_date < from_date:
                                     # Too old, stop searching this type
                                     break
                             except (ValueError, TypeError) as e:
-                                LOG.debug(f"Could not parse date for {bill_type.upper()}.{bill_num}: {e}")
+                                LOG.debug("Could not parse date for %s.%s: %s", bill_type.upper(), bill_num, e)
                         else:
                             # Bill has no intro action - log but continue searching (don't count against consecutive_not_found)
-                            LOG.debug(f"Bill {bill_type.upper()}.{bill_num} has no IntroReferral action, continuing search")
+                            LOG.debug("Bill %s.%s has no IntroReferral action, continuing search", bill_type.upper(), bill_num)
                     else:
                         # Bill details not found - this could be a bill that doesn't exist yet
                         # Don't count this as consecutive_not_found, just skip and continue
-                        LOG.debug(f"Bill {bill_type.upper()}.{bill_num} not found (may not exist yet), continuing search")
+                        LOG.debug("Bill %s.%s not found (may not exist yet), continuing search", bill_type.upper(), bill_num)
                         continue
                 except Exception as e:
                     # Check if it's a 404 (bill doesn't exist) - this is expected when searching high numbers
                     if "404" in str(e):
-                        LOG.debug(f"Bill {bill_type.upper()}.{bill_num} does not exist (404), continuing search")
+                        LOG.debug("Bill %s.%s does not exist (404), continuing search", bill_type.upper(), bill_num)
                         continue
                     else:
                         # Other error - log as warning and continue searching
-                        LOG.warning(f"Error checking bill: {e}")
+                        LOG.warning("Error checking bill: %s", e)
                         continue
 
         # Check other bill types (HJRES, HRES, HCONRES) - use efficient search
@@ -285,28 +283,28 @@ def fetch_recent_bills(api_key: str, limit: int = 250, days_back: int = 7) -> Li
                                     all_bills.append(bill_data)
                                     other_bills_found += 1
                                     consecutive_not_found = 0
-                                    LOG.debug(f"Found recent {bill_type.upper()} bill: {bill_type.upper()}.{bill_num} introduced on {introduced_date} (via {intro_action.get('type')} action)")
+                                    LOG.debug("Found recent %s bill: %s.%s introduced on %s (via %s action)", bill_type.upper(), bill_type.upper(), bill_num, introduced_date, intro_action.get('type'))
                                 elif introduced_date < from_date:
                                     # Too old, stop searching this type
                                     break
                             except (ValueError, TypeError) as e:
-                                LOG.debug(f"Could not parse date for {bill_type.upper()}.{bill_num}: {e}")
+                                LOG.debug("Could not parse date for %s.%s: %s", bill_type.upper(), bill_num, e)
                         else:
                             # Bill has no intro action - log but continue searching (don't count against consecutive_not_found)
-                            LOG.debug(f"Bill {bill_type.upper()}.{bill_num} has no IntroReferral action, continuing search")
+                            LOG.debug("Bill %s.%s has no IntroReferral action, continuing search", bill_type.upper(), bill_num)
                     else:
                         # Bill details not found - this could be a bill that doesn't exist yet
                         # Don't count this as consecutive_not_found, just skip and continue
-                        LOG.debug(f"Bill {bill_type.upper()}.{bill_num} not found (may not exist yet), continuing search")
+                        LOG.debug("Bill %s.%s not found (may not exist yet), continuing search", bill_type.upper(), bill_num)
                         continue
                 except Exception as e:
                     # Check if it's a 404 (bill doesn't exist) - this is expected when searching high numbers
                     if "404" in str(e):
-                        LOG.debug(f"Bill {bill_type.upper()}.{bill_num} does not exist (404), continuing search")
+                        LOG.debug("Bill %s.%s does not exist (404), continuing search", bill_type.upper(), bill_num)
                         continue
                     else:
                         # Other error - log as warning and continue searching
-                        LOG.warning(f"Error checking bill: {e}")
+                        LOG.warning("Error checking bill: %s", e)
                         continue
 
         # Sort bills: HR bills first (descending by number), then other bills
@@ -340,11 +338,11 @@ def fetch_recent_bills(api_key: str, limit: int = 250, days_back: int = 7) -> Li
 
         session.close()
 
-        LOG.info(f"Successfully fetched {len(bills_batch)} bills introduced between {from_date} and {today}")
+        LOG.info("Successfully fetched %s bills introduced between %s and %s", len(bills_batch), from_date, today)
         return bills_batch
 
     except Exception as e:
-        LOG.error(f"Error fetching bills from Congress API: {e}")
+        LOG.error("Error fetching bills from Congress API: %s", e)
         session.close()
         return []
 
@@ -372,7 +370,7 @@ def get_bill_details(api_key: str, congress: str, bill_type: str, bill_number: s
         return data.get("bill", {})
     except Exception as e:
         if log_errors:
-            LOG.warning(f"Error fetching bill details for {bill_type} {bill_number}: {e}")
+            LOG.warning("Error fetching bill details for %s %s: %s", bill_type, bill_number, e)
         return {}
 
 
@@ -397,7 +395,7 @@ def get_bill_actions(api_key: str, congress: str, bill_type: str, bill_number: s
         data = response.json()
         return data.get("actions", [])
     except Exception as e:
-        LOG.warning(f"Error fetching bill actions for {bill_type} {bill_number}: {e}")
+        LOG.warning("Error fetching bill actions for %s %s: %s", bill_type, bill_number, e)
         return []
 
 
@@ -491,7 +489,7 @@ def extract_bill_data(bill: Dict[str, Any], bill_detail: Dict[str, Any] = None,
     """
     # Ensure bill is a dictionary
     if not isinstance(bill, dict):
-        LOG.warning(f"Bill data is not a dict: {type(bill)}")
+        LOG.warning("Bill data is not a dict: %s", type(bill))
         return {}
 
     bill_type = bill.get("bill_type", bill.get("type", "")).upper()
@@ -557,7 +555,7 @@ def extract_bill_data(bill: Dict[str, Any], bill_detail: Dict[str, Any] = None,
                 if summary_text:
                     summary = summary_text.strip()
         except Exception as e:
-            LOG.debug(f"Error extracting details from bill_detail: {e}")
+            LOG.debug("Error extracting details from bill_detail: %s", e)
 
     # Construct URL
     bill_type_map = {
@@ -628,7 +626,7 @@ def monitor_and_process_bills(api_key: str, limit: int = 50, post_to_x: bool = F
     Returns:
         Tuple of (number of bills processed, whether posting to X occurred)
     """
-    LOG.info(f"🔍 Starting bill monitoring - fetching bills introduced in the last 7 days")
+    LOG.info("🔍 Starting bill monitoring - fetching bills introduced in the last 7 days")
 
     # Use larger limit to capture all bills in the date range
     # We'll prioritize HR bills and sort them by number descending
@@ -645,7 +643,7 @@ def monitor_and_process_bills(api_key: str, limit: int = 50, post_to_x: bool = F
     for bill in bills:
         # Ensure bill is a dictionary
         if not isinstance(bill, dict):
-            LOG.warning(f"Skipping invalid bill object (not a dict): {type(bill)}")
+            LOG.warning("Skipping invalid bill object (not a dict): %s", type(bill))
             continue
 
         bill_type = bill.get("bill_type", "").upper()
@@ -654,26 +652,26 @@ def monitor_and_process_bills(api_key: str, limit: int = 50, post_to_x: bool = F
 
         # Skip if missing required fields
         if not all([bill_type, bill_number, congress]):
-            LOG.debug(f"Skipping bill with missing required fields: {bill}")
+            LOG.debug("Skipping bill with missing required fields: %s", bill)
             continue
 
-        LOG.debug(f"Processing bill {bill_type}.{bill_number} (Congress {congress})")
+        LOG.debug("Processing bill %s.%s (Congress %s)", bill_type, bill_number, congress)
 
         # Check if bill already exists in database (skip this check only when aggregating all bills)
         if not aggregate_all:
             try:
                 exists = bill_exists(init_db_connection(), congress, bill_number, bill_type)
                 if exists:
-                    LOG.info(f"⏭️ Bill {bill_type}.{bill_number} already exists in database - skipping")
+                    LOG.info("⏭️ Bill %s.%s already exists in database - skipping", bill_type, bill_number)
                     continue
             except Exception as e:
-                LOG.error(f"Database check failed for bill {bill_type}.{bill_number}: {e}")
+                LOG.error("Database check failed for bill %s.%s: %s", bill_type, bill_number, e)
                 continue
         else:
-            LOG.debug(f"📊 Aggregating all bills mode - including {bill_type}.{bill_number} regardless of database status")
+            LOG.debug("📊 Aggregating all bills mode - including %s.%s regardless of database status", bill_type, bill_number)
 
         # Get detailed information for the bill
-        LOG.info(f"📋 Bill discovered: {bill_type}.{bill_number} (Congress {congress})")
+        LOG.info("📋 Bill discovered: %s.%s (Congress %s)", bill_type, bill_number, congress)
         bill_detail = get_bill_details(api_key, congress, bill_type.lower(), bill_number)
         bill_data = extract_bill_data(bill, bill_detail)
         bills_to_process.append(bill_data)
@@ -682,20 +680,19 @@ def monitor_and_process_bills(api_key: str, limit: int = 50, post_to_x: bool = F
     if bills_to_process:
         try:
             # Choose PNG filename based on mode and create timestamped name
-            from datetime import datetime
             timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
             png_basename = f"fedbillsummary-{timestamp}.png"
             png_filename = os.path.join(os.path.dirname(__file__), "..", "summary_images", png_basename)
             processed_count, x_posting_successful = poster.process_bills_into_posts(bills_to_process, post_to_x=post_to_x, create_png=True, png_filename=png_filename)
             posting_occurred = x_posting_successful
             if aggregate_all:
-                LOG.info(f"✅ Successfully aggregated {processed_count} bills and created PNG image")
+                LOG.info("✅ Successfully aggregated %s bills and created PNG image", processed_count)
             elif post_to_x:
-                LOG.info(f"✅ Successfully processed {processed_count} bills into posts and posted to X.com")
+                LOG.info("✅ Successfully processed %s bills into posts and posted to X.com", processed_count)
             else:
-                LOG.info(f"✅ Successfully processed {processed_count} bills into posts and created PNG image")
+                LOG.info("✅ Successfully processed %s bills into posts and created PNG image", processed_count)
         except Exception as e:
-            LOG.error(f"Failed to process bills into posts: {e}")
+            LOG.error("Failed to process bills into posts: %s", e)
             return 0, False
     else:
         if aggregate_all:
@@ -705,14 +702,12 @@ def monitor_and_process_bills(api_key: str, limit: int = 50, post_to_x: bool = F
         processed_count = 0
         posting_occurred = False
 
-    LOG.info(f"📊 Bill monitoring complete - processed {processed_count} bills")
+    LOG.info("📊 Bill monitoring complete - processed %s bills", processed_count)
     return processed_count, posting_occurred
 
 
 def main() -> int:
     """Main entry point."""
-    import sys
-
     # Parse command line arguments
     post_to_x = "--post-to-x" in sys.argv
     aggregate_all = "--aggregate-all" in sys.argv
@@ -738,7 +733,7 @@ def main() -> int:
         api_key = get_api_key(api_key_file)
         LOG.info("Successfully loaded Congress API key")
     except Exception as e:
-        LOG.error(f"Failed to load API key: {e}")
+        LOG.error("Failed to load API key: %s", e)
         return 1
 
     if continuous:
@@ -769,16 +764,16 @@ def main() -> int:
                     # Update posting cycle tracking
                     if posting_occurred:
                         last_post_cycle = current_cycle
-                        LOG.info(f"✅ Successfully posted in this cycle - next X posting allowed after 3 hours")
+                        LOG.info("✅ Successfully posted in this cycle - next X posting allowed after 3 hours")
                     elif processed > 0:
-                        LOG.info(f"📋 Processed {processed} bill(s) - PNG created, no X posting occurred")
+                        LOG.info("📋 Processed %s bill(s) - PNG created, no X posting occurred", processed)
                     else:
                         LOG.info("🔍 Scan complete - no new bills to process")
 
                     countdown_timer(monitoring_interval, "Next scan")
 
                 except Exception as e:
-                    LOG.error(f"❌ Monitoring error: {e}")
+                    LOG.error("❌ Monitoring error: %s", e)
                     countdown_timer(monitoring_interval, "Retrying scan")
 
         except KeyboardInterrupt:
@@ -789,16 +784,16 @@ def main() -> int:
         try:
             processed, posting_occurred = monitor_and_process_bills(api_key, limit=50, post_to_x=post_to_x, aggregate_all=aggregate_all)
             if aggregate_all:
-                LOG.info(f"Monitoring session complete - {processed} bills aggregated and PNG created")
+                LOG.info("Monitoring session complete - %s bills aggregated and PNG created", processed)
             elif post_to_x and posting_occurred:
-                LOG.info(f"Monitoring session complete - {processed} bills processed and posted to X.com")
+                LOG.info("Monitoring session complete - %s bills processed and posted to X.com", processed)
             elif post_to_x:
-                LOG.info(f"Monitoring session complete - {processed} bills processed (X posting failed)")
+                LOG.info("Monitoring session complete - %s bills processed (X posting failed)", processed)
             else:
-                LOG.info(f"Monitoring session complete - {processed} bills processed")
+                LOG.info("Monitoring session complete - %s bills processed", processed)
             return 0
         except Exception as e:
-            LOG.error(f"Monitoring failed: {e}")
+            LOG.error("Monitoring failed: %s", e)
             return 1
 
 
@@ -807,10 +802,6 @@ def demonstrate_adaptive_search():
     Demonstration function showing how the adaptive search works.
     This function shows how the system automatically adjusts to find new bills.
     """
-    import sys
-    sys.path.append('..')
-    from api.congress_api import get_api_key
-
     # Get API key
     try:
         api_key_file = os.path.join("..", "api", "congress_api_key.txt")
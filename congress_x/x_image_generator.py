@@ -1,15 +1,25 @@
+import io
 import logging
 import os
-from datetime import datetime, timezone, timedelta
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
+# Import shared bill helpers
+try:
+    from .bill_utils import dedupe_by_bill_number, now_est_strings
+except ImportError:
+    from bill_utils import dedupe_by_bill_number, now_est_strings
+
 LOG = logging.getLogger("x_image_generator")
 
 try:
     from PIL import Image, ImageDraw, ImageFont
     LOG.info("PIL modules imported successfully at module level")
 except ImportError as e:
-    LOG.error(f"PIL import failed at module level: {e}")
+    LOG.error("PIL import failed at module level: %s", e)
     # Try alternative import methods
     try:
         import PIL.Image as Image
@@ -17,18 +27,157 @@ except ImportError as e:
         import PIL.ImageFont as ImageFont
         LOG.info("PIL modules imported successfully using alternative method")
     except ImportError as e2:
-        LOG.error(f"Alternative PIL import also failed: {e2}")
+        LOG.error("Alternative PIL import also failed: %s", e2)
         Image = None
         ImageDraw = None
         ImageFont = None
 
+# Optional lossless PNG optimizer (pip install pyoxipng) for archived images; skipped when missing
+try:
+    import oxipng
+except ImportError:
+    oxipng = None
+
+_PIL_OK = Image is not None and ImageDraw is not None and ImageFont is not None
+_PIL_IMPORT_ATTEMPTED = _PIL_OK
+
+
+def _ensure_pil() -> bool:
+    """
+    Retry the PIL import once per process if it failed at module load.
+
+    Returns:
+        True if PIL modules are available, False otherwise
+    """
+    global Image, ImageDraw, ImageFont, _PIL_OK, _PIL_IMPORT_ATTEMPTED
+    if _PIL_OK or _PIL_IMPORT_ATTEMPTED:
+        return _PIL_OK
+    _PIL_IMPORT_ATTEMPTED = True
+    LOG.warning("PIL modules not available at module level, trying runtime import...")
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+        _PIL_OK = True
+        LOG.info("PIL runtime import successful")
+    except ImportError as e:
+        LOG.error("PIL runtime import failed: %s", e)
+    return _PIL_OK
+
+
+# Loaded fonts keyed by (path, size); FreeType face setup is paid once per process
+_FONT_CACHE = {}
+_DEFAULT_FONT_KEY = ("<default>", 0)
+
+
+def _get_default_font():
+    """Return PIL's built-in default font, loading it once."""
+    font = _FONT_CACHE.get(_DEFAULT_FONT_KEY)
+    if font is None:
+        font = _FONT_CACHE[_DEFAULT_FONT_KEY] = ImageFont.load_default()
+    return font
+
+
+def _get_font(path: str, size: int):
+    """
+    Load a TrueType font once per (path, size) and reuse it across images.
+
+    Args:
+        path: Font file path or name (e.g., "arial.ttf")
+        size: Font size in points
+
+    Returns:
+        Font object, or the default font if the font file cannot be loaded
+    """
+    key = (path, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        try:
+            font = ImageFont.truetype(path, size)
+        except OSError:
+            font = _get_default_font()
+        _FONT_CACHE[key] = font
+    return font
+
+
+# Scratch draw surface for text measurement, created on first use
+_MEASURE_DRAW = None
+
+
+@lru_cache(maxsize=4096)
+def _text_bbox(font, text: str) -> tuple:
+    """
+    Measure the bounding box of text, memoized per (font, text).
+
+    Args:
+        font: Font to measure with (cached font objects keep a stable identity)
+        text: Text to measure
+
+    Returns:
+        Bounding box tuple (left, top, right, bottom)
+    """
+    global _MEASURE_DRAW
+    if _MEASURE_DRAW is None:
+        _MEASURE_DRAW = ImageDraw.Draw(Image.new('RGB', (1, 1), color='white'))
+    return _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+
+
+@lru_cache(maxsize=8192)
+def _text_width(font, text: str) -> float:
+    """
+    Measure the horizontal advance of text, memoized per (font, text).
+    Uses font.getlength, which skips the glyph bitmap pass textbbox needs.
+
+    Args:
+        font: Font to measure with
+        text: Text to measure
+
+    Returns:
+        Advance width in pixels
+    """
+    return font.getlength(text)
+
+
+def _write_png(image, output_path: str, **save_kwargs) -> int:
+    """
+    Encode an image as PNG in memory and write it to disk in one block.
+
+    Args:
+        image: PIL image to encode
+        output_path: Path to write the PNG file
+        **save_kwargs: Extra PNG encoder options passed to Image.save
+
+    Returns:
+        Number of bytes written
+    """
+    buf = io.BytesIO()
+    image.save(buf, "PNG", **save_kwargs)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(output_path, flags, 0o644)
+    try:
+        with buf.getbuffer() as data:
+            written = 0
+            while written < len(data):
+                written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+    return written
+
+
+def _optimize_png(path: str) -> None:
+    """Losslessly recompress a PNG in place with oxipng."""
+    try:
+        oxipng.optimize(path, level=2)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("oxipng optimized %s (%s bytes)", path, os.path.getsize(path))
+    except Exception as e:
+        LOG.warning("oxipng optimization failed for %s: %s", path, e)
+
 
 class XImageGenerator:
     def __init__(self):
         """Initialize XImageGenerator."""
         LOG.info("XImageGenerator initialized")
 
-    def _wrap_text(self, text: str, max_width: int, font, draw) -> list:
+    def _wrap_text(self, text: str, max_width: int, font) -> list:
         """
         Wrap text to fit within max_width using the given font.
 
@@ -36,28 +185,59 @@ class XImageGenerator:
             text: Text to wrap
             max_width: Maximum width in pixels
             font: Font to use for measurement
-            draw: ImageDraw object for textbbox
 
         Returns:
             List of wrapped lines
         """
         lines = []
-        words = text.split()
-        current_line = ""
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            line_width = bbox[2] - bbox[0]
+        line_words = []
+        current_width = 0
+        space_width = _text_width(font, " ")
+        # Sum cached per-word widths instead of re-measuring the growing line for every word
+        for word in text.split():
+            word_width = _text_width(font, word)
+            line_width = current_width + space_width + word_width if line_words else word_width
             if line_width <= max_width:
-                current_line = test_line
+                line_words.append(word)
+                current_width = line_width
             else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
+                if line_words:
+                    lines.append(" ".join(line_words))
+                line_words = [word]
+                current_width = word_width
+        if line_words:
+            lines.append(" ".join(line_words))
         return lines
 
+    def _layout_bill(self, bill_data: Dict[str, Any], bill_font, bold_font, max_line_width: int) -> Dict[str, Any]:
+        """
+        Wrap a bill's title and sponsor text once, for both height estimation and drawing.
+
+        Args:
+            bill_data: Bill data dictionary
+            bill_font: Font for title and sponsor text
+            bold_font: Font for the bill number
+            max_line_width: Maximum line width in pixels
+
+        Returns:
+            Layout dictionary with the bill number width and wrapped title and sponsor lines
+        """
+        bill_number = bill_data.get('formatted_bill_number', '')
+        title = bill_data.get('title', '')
+        sponsor = bill_data.get('sponsor', 'Unknown')
+        introduced_date = bill_data.get('introduced_date', 'Unknown')
+
+        bold_bbox = _text_bbox(bold_font, bill_number)
+        title_text = f" - {title}" if title else ""
+        sponsor_text = f"Sponsor: {sponsor} | Introduced: {introduced_date}"
+
+        return {
+            'bill_number': bill_number,
+            'bold_width': bold_bbox[2] - bold_bbox[0],
+            'title_lines': self._wrap_text(title_text, max_line_width - bold_bbox[2] - 10, bill_font),
+            'sponsor_lines': self._wrap_text(sponsor_text, max_line_width, bill_font),
+        }
+
     def create_bills_png(self, bills_data: list, output_path: str = "federal_bills_summary.png", image_num: Optional[int] = None, total_images: Optional[int] = None) -> str:
         """
         Create a PNG image summarizing bills with formatted text.
@@ -71,23 +251,9 @@ class XImageGenerator:
         Returns:
             Path to the created image file if successful, empty string otherwise
         """
-        # Check module-level PIL availability
-        import sys
-        current_module = sys.modules[__name__]
-        pil_available = all([current_module.Image, current_module.ImageDraw, current_module.ImageFont])
-        LOG.info(f"Checking PIL availability: {pil_available}")
-        if not pil_available:
-            LOG.warning("PIL modules not available at module level, trying runtime import...")
-            try:
-                # Import PIL modules and assign to module level
-                from PIL import Image as PILImage, ImageDraw as PILImageDraw, ImageFont as PILImageFont
-                current_module.Image = PILImage
-                current_module.ImageDraw = PILImageDraw
-                current_module.ImageFont = PILImageFont
-                LOG.info("PIL runtime import successful")
-            except ImportError as e:
-                LOG.error(f"PIL runtime import failed: {e}")
-                return ""
+        # PIL availability is resolved once per process
+        if not _PIL_OK and not _ensure_pil():
+            return ""
 
         try:
             # Image settings - 16:9 aspect ratio (1920x1080 for higher resolution)
@@ -107,9 +273,8 @@ class XImageGenerator:
             other_bg_color = (245, 245, 245)  # Light gray for others
 
             # Create title
-            est_tz = timezone(timedelta(hours=-5))  # EST is UTC-5
-            est_time = datetime.now(est_tz)
-            title = f"@FedBillAlert Summary - {est_time.strftime('%Y-%m-%d %I:%M %p EST')}"
+            date_str, time_str = now_est_strings()
+            title = f"@FedBillAlert Summary - {date_str} {time_str}"
             if total_images and total_images > 1 and image_num:
                 title += f" (Part {image_num} of {total_images}: {len(bills_data)} bills)"
             else:
@@ -118,62 +283,40 @@ class XImageGenerator:
             # Store bill data for processing (we'll format in the drawing loop to include sponsor info)
             bill_data_list = bills_data
 
-            # Load fonts (regular and bold)
-            try:
-                title_font = ImageFont.truetype("arial.ttf", title_font_size)
-                bill_font = ImageFont.truetype("arial.ttf", bill_font_size)
-                bold_font = ImageFont.truetype("arialbd.ttf", bill_font_size)  # Bold variant for bill numbers
-                is_default_font = False
-                LOG.info("Using truetype font (arial.ttf and arialbd.ttf)")
-            except OSError:
-                title_font = ImageFont.load_default()
-                bill_font = ImageFont.load_default()
-                bold_font = ImageFont.load_default()  # Fallback, no bold
-                is_default_font = True
+            # Load fonts (regular and bold) from the shared font cache
+            title_font = _get_font("arial.ttf", title_font_size)
+            bill_font = _get_font("arial.ttf", bill_font_size)
+            bold_font = _get_font("arialbd.ttf", bill_font_size)  # Bold variant for bill numbers
+            default_font = _get_default_font()
+            is_default_font = default_font in (title_font, bill_font, bold_font)
+            if is_default_font:
+                title_font = bill_font = bold_font = default_font  # Fallback, no bold
                 LOG.warning("Fallback to default font - scaling disabled")
+            else:
+                LOG.info("Using truetype font (arial.ttf and arialbd.ttf)")
 
             # Compute line heights from font metrics
             title_line_height = title_font.getmetrics()[0] + title_font.getmetrics()[1]
             line_height = bill_font.getmetrics()[0] + bill_font.getmetrics()[1]
 
-            # Create temporary draw for measurements
-            temp_image = Image.new('RGB', (1, 1), color='white')
-            temp_draw = ImageDraw.Draw(temp_image)
-
             # Compute title height (use bbox for precise height)
-            title_bbox = temp_draw.textbbox((0, 0), title, font=title_font)
+            title_bbox = _text_bbox(title_font, title)
             title_height = title_bbox[3] - title_bbox[1]
 
             # Max width for bill text
             max_line_width = width - (padding * 2)
 
-            # Compute total bill height
-            def compute_total_bill_height(bill_data_list, bill_font, bold_font, line_height):
-                total = 0
-                for bill_data in bill_data_list:
-                    bill_number = bill_data.get('formatted_bill_number', '')
-                    title = bill_data.get('title', '')
-                    sponsor = bill_data.get('sponsor', 'Unknown')
-
-                    # Calculate lines for title (after bill number)
-                    title_text = f" - {title}" if title else ""
-                    bill_number_width = temp_draw.textbbox((0, 0), bill_number, font=bold_font)[2] - temp_draw.textbbox((0, 0), bill_number, font=bold_font)[0]
-                    title_lines = self._wrap_text(title_text, max_line_width - bill_number_width - 10, bill_font, temp_draw)
-
-                    # Calculate lines for sponsor with introduced date
-                    introduced_date = bill_data.get('introduced_date', 'Unknown')
-                    sponsor_text = f"Sponsor: {sponsor} | {introduced_date}"
-                    sponsor_lines = self._wrap_text(sponsor_text, max_line_width, bill_font, temp_draw)
-
-                    total_lines = len(title_lines) + len(sponsor_lines)
-                    total += total_lines * line_height
+            # Wrap every bill once; the same layouts drive scaling and drawing
+            def layout_bills(bill_font, bold_font, line_height):
+                layouts = [self._layout_bill(bill_data, bill_font, bold_font, max_line_width) for bill_data in bill_data_list]
+                total = sum(len(layout['title_lines']) + len(layout['sponsor_lines']) for layout in layouts) * line_height
 
                 # Add separators (n-1) * separator_space
-                if len(bill_data_list) > 1:
-                    total += (len(bill_data_list) - 1) * (line_height * separator_height_factor)
-                return total
+                if len(layouts) > 1:
+                    total += (len(layouts) - 1) * (line_height * separator_height_factor)
+                return layouts, total
 
-            total_bill_height = compute_total_bill_height(bill_data_list, bill_font, bold_font, line_height)
+            layouts, total_bill_height = layout_bills(bill_font, bold_font, line_height)
 
             # Available height for bills
             available_height = height - (padding * 2) - title_height - margin_after_title - extra_bottom_padding
@@ -182,29 +325,28 @@ class XImageGenerator:
             if total_bill_height > available_height and not is_default_font:
                 scale_factor = available_height / total_bill_height
                 new_bill_font_size = max(min_bill_font_size, int(bill_font_size * scale_factor))
-                bill_font = ImageFont.truetype("arial.ttf", new_bill_font_size)
-                bold_font = ImageFont.truetype("arialbd.ttf", new_bill_font_size)
+                bill_font = _get_font("arial.ttf", new_bill_font_size)
+                bold_font = _get_font("arialbd.ttf", new_bill_font_size)
                 line_height = bill_font.getmetrics()[0] + bill_font.getmetrics()[1]
-                LOG.info(f"Scaled bill font to {new_bill_font_size}pt, line_height={line_height}px")
+                LOG.info("Scaled bill font to %spt, line_height=%spx", new_bill_font_size, line_height)
 
-                # Recompute total_bill_height with new font (wrapping may change)
-                total_bill_height = compute_total_bill_height(bill_data_list, bill_font, bold_font, line_height)
+                # Relayout with new font (wrapping may change)
+                layouts, total_bill_height = layout_bills(bill_font, bold_font, line_height)
 
                 # Further reduce font size incrementally if still doesn't fit (to prevent clipping)
                 while total_bill_height > available_height and new_bill_font_size > min_bill_font_size:
                     new_bill_font_size -= 1
-                    bill_font = ImageFont.truetype("arial.ttf", new_bill_font_size)
-                    bold_font = ImageFont.truetype("arialbd.ttf", new_bill_font_size)
+                    bill_font = _get_font("arial.ttf", new_bill_font_size)
+                    bold_font = _get_font("arialbd.ttf", new_bill_font_size)
                     line_height = bill_font.getmetrics()[0] + bill_font.getmetrics()[1]
-                    total_bill_height = compute_total_bill_height(bill_data_list, bill_font, bold_font, line_height)
-                    LOG.info(f"Further scaled bill font to {new_bill_font_size}pt to fit content")
+                    layouts, total_bill_height = layout_bills(bill_font, bold_font, line_height)
+                    LOG.info("Further scaled bill font to %spt to fit content", new_bill_font_size)
 
             # Create image with fixed 16:9 dimensions and light gray background
             image = Image.new('RGB', (width, height), color=(245, 245, 245))
             draw = ImageDraw.Draw(image)
 
-            # Draw title centered
-            title_bbox = draw.textbbox((0, 0), title, font=title_font)
+            # Draw title centered (title_bbox measured above)
             title_width = title_bbox[2] - title_bbox[0]
             title_x = (width - title_width) // 2
             draw.text((title_x, padding), title, fill='black', font=title_font)
@@ -212,28 +354,32 @@ class XImageGenerator:
             # Start position for bills
             y_position = padding + title_height + margin_after_title
 
+            # Loop invariants for the drawing pass
+            line_advance = int(line_height * 1.5)
+            bottom_limit = height - padding
+            line_limit = bottom_limit - line_height
+            half_line_height = line_height // 2
+            last_index = len(bill_data_list) - 1
+            separator_end_x = width - padding
+            stripe_left = padding - 10
+            stripe_right = width - padding + 11
+
             # Draw bills (left-aligned for better readability)
-            for i, bill_data in enumerate(bill_data_list):
+            for i, (bill_data, layout) in enumerate(zip(bill_data_list, layouts)):
                 # Extract bill information
-                bill_number = bill_data.get('formatted_bill_number', '')
-                title = bill_data.get('title', '')
+                bill_number = layout['bill_number']
                 sponsor = bill_data.get('sponsor', 'Unknown')
                 sponsor_party = bill_data.get('sponsor_party', 'Unknown')
-
-                # Format text for wrapping calculations
-                title_text = f" - {title}" if title else ""
-                introduced_date = bill_data.get('introduced_date', 'Unknown')
-                sponsor_text = f"Sponsor: {sponsor} | Introduced: {introduced_date}"
+                title_lines = layout['title_lines']
+                sponsor_lines = layout['sponsor_lines']
 
                 # Compute the height of this bill entry (bill number + title + sponsor)
-                title_lines = self._wrap_text(title_text, max_line_width - draw.textbbox((0, 0), bill_number, font=bold_font)[2] - 10, bill_font, draw)
-                sponsor_lines = self._wrap_text(sponsor_text, max_line_width, bill_font, draw)
                 total_lines = len(title_lines) + len(sponsor_lines)
-                bill_entry_height = total_lines * int(line_height * 1.5)
+                bill_entry_height = total_lines * line_advance
 
                 # Check if there's enough space for this entire bill before drawing it
-                if y_position + bill_entry_height + line_height >= height - padding:  # Add line_height for separator
-                    LOG.info(f"Reached image height limit - {i}/{len(bill_data_list)} bills displayed")
+                if y_position + bill_entry_height + line_height >= bottom_limit:  # Add line_height for separator
+                    LOG.info("Reached image height limit - %s/%s bills displayed", i, len(bill_data_list))
                     break
 
                 # Determine color based on bill type
@@ -250,59 +396,54 @@ class XImageGenerator:
                 # Determine sponsor color based on party
                 if sponsor_party.upper() == 'D' or sponsor_party.upper() == 'DEMOCRAT':
                     sponsor_color = (0, 174, 243)  # #00AEF3 for Democrats
-                    LOG.debug(f"Using Democrat color for sponsor: {sponsor} (party: {sponsor_party})")
+                    LOG.debug("Using Democrat color for sponsor: %s (party: %s)", sponsor, sponsor_party)
                 elif sponsor_party.upper() == 'R' or sponsor_party.upper() == 'REPUBLICAN':
                     sponsor_color = (233, 20, 29)  # #E9141D for Republicans
-                    LOG.debug(f"Using Republican color for sponsor: {sponsor} (party: {sponsor_party})")
+                    LOG.debug("Using Republican color for sponsor: %s (party: %s)", sponsor, sponsor_party)
                 else:
                     sponsor_color = (100, 100, 100)  # Gray for unknown/independent
-                    LOG.debug(f"Using unknown color for sponsor: {sponsor} (party: {sponsor_party})")
+                    LOG.debug("Using unknown color for sponsor: %s (party: %s)", sponsor, sponsor_party)
 
-                # Draw background stripe
-                draw.rectangle([(padding - 10, y_position - 5), (width - padding + 10, y_position + bill_entry_height + 5)], fill=bg_color)
+                # Fill background stripe directly (paste box is end-exclusive, rectangle was inclusive)
+                image.paste(bg_color, (stripe_left, y_position - 5, stripe_right, y_position + bill_entry_height + 6))
 
                 # Draw bill number with color
                 x_pos = padding
-                bold_bbox = draw.textbbox((0, 0), bill_number, font=bold_font)
-                bold_width = bold_bbox[2] - bold_bbox[0]
                 draw.text((x_pos, y_position), bill_number, fill=bill_color, font=bold_font)
-                x_pos += bold_width + 10
+                x_pos += layout['bold_width'] + 10
 
                 # Draw title (wrapped if needed)
                 current_line_y = y_position
                 for j, line in enumerate(title_lines):
-                    if current_line_y + line_height > height - padding:
-                        LOG.info(f"Insufficient space for remaining lines in bill {i+1}")
+                    if current_line_y > line_limit:
+                        LOG.info("Insufficient space for remaining lines in bill %s", i+1)
                         break
                     draw.text((x_pos if j == 0 else padding, current_line_y), line, fill='black', font=bill_font)
-                    current_line_y += int(line_height * 1.5)
+                    current_line_y += line_advance
 
                 # Draw sponsor information
                 for j, line in enumerate(sponsor_lines):
-                    if current_line_y + line_height > height - padding:
-                        LOG.info(f"Insufficient space for sponsor lines in bill {i+1}")
+                    if current_line_y > line_limit:
+                        LOG.info("Insufficient space for sponsor lines in bill %s", i+1)
                         break
                     draw.text((padding, current_line_y), line, fill=sponsor_color, font=bill_font)
-                    current_line_y += int(line_height * 1.5)
+                    current_line_y += line_advance
 
                 y_position = current_line_y
 
                 # Add horizontal separator line after each bill (except the last one)
-                if i < len(bill_data_list) - 1 and y_position < height - padding:
-                    y_position += line_height // 2
-                    line_start_x = padding
-                    line_end_x = width - padding
-                    draw.line((line_start_x, y_position, line_end_x, y_position), fill='black', width=2)  # Thicker separator
-                    y_position += line_height // 2
-
-            # Save image with optimization
-            image.save(output_path, "PNG", optimize=True)
-            file_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
-            LOG.info(f"Successfully created PNG image at: {os.path.abspath(output_path)} ({file_size} bytes)")
+                if i < last_index and y_position < bottom_limit:
+                    y_position += half_line_height
+                    draw.line((padding, y_position, separator_end_x, y_position), fill='black', width=2)  # Thicker separator
+                    y_position += half_line_height
+
+            # Save image with the fastest zlib level (X re-encodes uploads anyway)
+            file_size = _write_png(image, output_path, compress_level=1, optimize=False)
+            LOG.info("Successfully created PNG image at: %s (%s bytes)", os.path.abspath(output_path), file_size)
             return output_path
 
         except Exception as e:
-            LOG.error(f"Failed to create PNG image: {e}")
+            LOG.error("Failed to create PNG image: %s", e)
             return ""
 
     def create_multiple_bills_pngs(self, bills_data: list, base_filename: str = "federal_bills_summary.png") -> list:
@@ -322,18 +463,10 @@ class XImageGenerator:
             return []
 
         # Deduplicate bills by formatted_bill_number to prevent duplicates in images
-        seen_bills = {}
-        deduplicated_bills = []
-        for bill in bills_data:
-            bill_id = bill.get('formatted_bill_number', '')
-            if bill_id and bill_id not in seen_bills:
-                seen_bills[bill_id] = True
-                deduplicated_bills.append(bill)
-            elif not bill_id:
-                deduplicated_bills.append(bill)
+        deduplicated_bills = dedupe_by_bill_number(bills_data)
 
         if len(deduplicated_bills) < len(bills_data):
-            LOG.warning(f"Deduplicated bills: {len(bills_data)} -> {len(deduplicated_bills)} (removed {len(bills_data) - len(deduplicated_bills)} duplicates)")
+            LOG.warning("Deduplicated bills: %s -> %s (removed %s duplicates)", len(bills_data), len(deduplicated_bills), len(bills_data) - len(deduplicated_bills))
 
         bills_data = deduplicated_bills
 
@@ -350,13 +483,20 @@ class XImageGenerator:
         if max_images is not None:
             num_images = min(num_images, max_images)
 
-        LOG.info(f"Creating {num_images} PNG image(s) from {total_bills} bills")
+        LOG.info("Creating %s PNG image(s) from %s bills", num_images, total_bills)
+
+        # Common case: everything fits on one image, no chunking or part filenames needed
+        if num_images == 1:
+            image_path = self.create_bills_png(bills_data, base_filename)
+            return [image_path] if image_path else []
 
         # Evenly distribute bills across num_images
         chunk_size = total_bills // num_images
         remainder = total_bills % num_images
         current_start = 0
+        stem, dot, ext = base_filename.rpartition('.')
 
+        page_specs = []
         for image_num in range(1, num_images + 1):
             this_chunk_size = chunk_size + 1 if (image_num - 1) < remainder else chunk_size
             end_idx = current_start + this_chunk_size
@@ -367,24 +507,60 @@ class XImageGenerator:
                 break
 
             # Create filename for this image
-            if num_images == 1:
-                image_filename = base_filename
-            else:
-                name_parts = base_filename.rsplit('.', 1)
-                image_filename = f"{name_parts[0]}_part{image_num}.{name_parts[1]}" if len(name_parts) > 1 else f"{base_filename}_part{image_num}"
+            image_filename = f"{stem}_part{image_num}.{ext}" if dot else f"{base_filename}_part{image_num}"
+            page_specs.append((image_num, bills_chunk, image_filename))
 
+        # Render pages concurrently; Pillow drops the GIL while encoding, and
+        # threads share the font and measurement caches (a process pool would not)
+        def render_page(spec):
+            image_num, bills_chunk, image_filename = spec
             # Create the PNG image, passing image_num and total_images for title
-            image_path = self.create_bills_png(bills_chunk, image_filename, image_num=image_num, total_images=num_images)
+            return self.create_bills_png(bills_chunk, image_filename, image_num=image_num, total_images=num_images)
+
+        with ThreadPoolExecutor(max_workers=min(len(page_specs), os.cpu_count() or 1)) as executor:
+            rendered = list(executor.map(render_page, page_specs))
 
+        for (image_num, bills_chunk, _), image_path in zip(page_specs, rendered):
             if image_path:
                 image_paths.append(image_path)
-                LOG.info(f"Image {image_num}/{num_images}: {len(bills_chunk)} bills")
+                LOG.info("Image %s/%s: %s bills", image_num, num_images, len(bills_chunk))
             else:
-                LOG.error(f"Failed to create image {image_num}/{num_images}")
+                LOG.error("Failed to create image %s/%s", image_num, num_images)
 
-        LOG.info(f"Successfully created {len(image_paths)} PNG image(s)")
+        LOG.info("Successfully created %s PNG image(s)", len(image_paths))
         return image_paths
 
+    def _archive_one(self, image_path: str, archive_dir: str) -> bool:
+        """
+        Move a single image into the archive directory, then (with oxipng available)
+        losslessly shrink the archived copy; images are archived only after posting.
+
+        Args:
+            image_path: Path of the image to archive
+            archive_dir: Destination directory
+
+        Returns:
+            True if the image was archived, False otherwise
+        """
+        filename = os.path.basename(image_path)
+        archive_path = os.path.join(archive_dir, filename)
+        try:
+            # Rename is a single syscall on the same filesystem; fall back to copy+delete across devices
+            try:
+                os.replace(image_path, archive_path)
+            except FileNotFoundError:
+                LOG.warning("Image file not found for archiving: %s", image_path)
+                return False
+            except OSError:
+                shutil.move(image_path, archive_path)
+            LOG.info("✅ Archived: %s → %s", filename, archive_dir)
+        except Exception as e:
+            LOG.error("Failed to archive image %s: %s", image_path, e)
+            return False
+        if oxipng is not None:
+            _optimize_png(archive_path)
+        return True
+
     def archive_images(self, image_paths: list) -> bool:
         """
         Move PNG images to archive folder with today's date.
@@ -403,41 +579,25 @@ class XImageGenerator:
         try:
             # Create archive directory path with today's date
             archive_base = os.path.join(os.path.dirname(__file__), "..", "archive")
-            today_date = datetime.now().strftime("%Y-%m-%d")
+            today_date = datetime.now().date().isoformat()
             archive_dir = os.path.join(archive_base, today_date)
 
             # Create archive directory if it doesn't exist
             os.makedirs(archive_dir, exist_ok=True)
-            LOG.info(f"📁 Archive directory ready: {archive_dir}")
-
-            archived_count = 0
-            for image_path in image_paths:
-                try:
-                    if not os.path.exists(image_path):
-                        LOG.warning(f"Image file not found for archiving: {image_path}")
-                        continue
-
-                    # Get filename from path
-                    filename = os.path.basename(image_path)
-                    archive_path = os.path.join(archive_dir, filename)
-
-                    # Move file to archive
-                    import shutil
-                    shutil.move(image_path, archive_path)
-                    archived_count += 1
-                    LOG.info(f"✅ Archived: {filename} → {archive_dir}")
+            LOG.info("📁 Archive directory ready: %s", archive_dir)
 
-                except Exception as e:
-                    LOG.error(f"Failed to archive image {image_path}: {e}")
-                    continue
+            # Moves are independent, so overlap them (cross-filesystem moves copy bytes)
+            with ThreadPoolExecutor(max_workers=min(len(image_paths), 8)) as executor:
+                results = list(executor.map(lambda image_path: self._archive_one(image_path, archive_dir), image_paths))
+            archived_count = sum(results)
 
             if archived_count > 0:
-                LOG.info(f"📦 Successfully archived {archived_count} out of {len(image_paths)} images to {archive_dir}")
+                LOG.info("📦 Successfully archived %s out of %s images to %s", archived_count, len(image_paths), archive_dir)
                 return True
             else:
                 LOG.warning("Failed to archive any images")
                 return False
 
         except Exception as e:
-            LOG.error(f"Failed to create archive directory: {e}")
+            LOG.error("Failed to create archive directory: %s", e)
             return False
\ No newline at end of file
@@ -1,6 +1,9 @@
 import logging
 import os
-from datetime import datetime, timezone, timedelta
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 # Import database functions
@@ -8,18 +11,58 @@ try:
     from ..sqlite.new_Legislation_log import log_bill_from_data, bill_exists, init_db_connection
 except ImportError:
     from pathlib import Path
-    import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     from sqlite.new_Legislation_log import log_bill_from_data, bill_exists, init_db_connection
 
-# Import image generator
+# Import X API clients (only needed when posting); a failed import is re-raised on first post
+_X_API_IMPORT_ERROR = None
+try:
+    from ..api.x_api_call import get_x_api_client, get_x_api
+except ImportError:
+    try:
+        from api.x_api_call import get_x_api_client, get_x_api
+    except ImportError as e:
+        get_x_api_client = get_x_api = None
+        _X_API_IMPORT_ERROR = e
+
+# Import image generator and shared bill helpers
 try:
     from .x_image_generator import XImageGenerator
+    from .bill_utils import dedupe_by_bill_number, now_est_strings
 except ImportError:
     from x_image_generator import XImageGenerator
+    from bill_utils import dedupe_by_bill_number, now_est_strings
 
 LOG = logging.getLogger("x_poster")
 
+MAX_UPLOAD_WORKERS = 4  # Matches X.com's 4-media-per-tweet limit
+MAX_IMAGE_UPLOAD_BYTES = 5 * 1024 * 1024  # X.com's size limit for image uploads
+
+# Tweet templates; the checks below run at import and prove every rendering fits
+# X.com's 280-character limit (counts bounded to 5 digits), so no runtime truncation is needed
+MAX_TWEET_LENGTH = 280
+BILLS_TWEET_TEMPLATE = "🚨 NOTICE: Congress Unviels New Bills ({date}, {count} identified)! View key details in the Attached Images or directly at https://www.congress.gov/bills-with-chamber-action/browse-by-date📄."
+SEQUENCE_TWEET_TEMPLATE = "Introduced Legislation - {date} {time}. Tweet {num} of {total}. See images for bill details or visit https://tinyurl.com/recentbills"
+SINGLE_TWEET_TEMPLATE = "Introduced Legislation - {date} {time}. {images} image(s) with bill details. Visit https://tinyurl.com/recentbills"
+assert len(BILLS_TWEET_TEMPLATE.format(date="0000-00-00", count=99999)) <= MAX_TWEET_LENGTH
+assert len(SEQUENCE_TWEET_TEMPLATE.format(date="0000-00-00", time="00:00 PM EST", num=99999, total=99999)) <= MAX_TWEET_LENGTH
+assert len(SINGLE_TWEET_TEMPLATE.format(date="0000-00-00", time="00:00 PM EST", images=99999)) <= MAX_TWEET_LENGTH
+
+
+@lru_cache(maxsize=1)
+def _get_x_clients() -> tuple:
+    """
+    Get the X API clients, creating them once per process.
+    Reusing the clients keeps their HTTP sessions (and pooled connections) alive
+    across posting calls and monitoring cycles, whichever XPoster makes them.
+
+    Returns:
+        Tuple of (v2 Client for posting, v1.1 API for media uploads)
+    """
+    if _X_API_IMPORT_ERROR is not None:
+        raise _X_API_IMPORT_ERROR
+    return get_x_api_client(), get_x_api()
+
 
 class XPoster:
     def __init__(self, output_file: str = "federal_bills.txt"):
@@ -31,7 +74,8 @@ class XPoster:
         """
         self.output_file = output_file
         self.image_generator = XImageGenerator()
-        LOG.info(f"XPoster initialized with output file: {output_file}")
+        self.persist_on_dry_run = False  # Store bills in the database even when nothing is rendered or posted
+        LOG.info("XPoster initialized with output file: %s", output_file)
 
     def format_bill_text(self, bill_data: Dict[str, Any], include_url: bool = True) -> str:
         """
@@ -45,17 +89,15 @@ class XPoster:
         Returns:
             Formatted bill text
         """
-        bill_number = bill_data.get('formatted_bill_number', '')
-        title = bill_data.get('title', '')
-        url = bill_data.get('url', '')
+        bill_number = bill_data.get('formatted_bill_number') or ''
+        title = bill_data.get('title') or ''
 
-        # Create the format: Bill - [Title of Bill]
-        if include_url and url and url != 'Unknown':
-            bill_text = f"{bill_number}({url}) - {title}"
-        else:
-            bill_text = f"{bill_number} - {title}"
-
-        return bill_text
+        # Create the format: Bill - [Title of Bill]; only look up the URL when it is used
+        if include_url:
+            url = bill_data.get('url')
+            if url and url != 'Unknown':
+                return f"{bill_number}({url}) - {title}"
+        return f"{bill_number} - {title}"
 
     def append_to_txt_file(self, bill_text: str, add_new_post_indicator: bool = False) -> None:
         """
@@ -65,15 +107,25 @@ class XPoster:
             bill_text: Formatted bill text to append
             add_new_post_indicator: Whether to add "new post" indicator
         """
-        try:
-            if add_new_post_indicator:
-                bill_text = f"new post\n{bill_text}"
+        if add_new_post_indicator:
+            self.append_many_to_txt_file(["new post", bill_text])
+        else:
+            self.append_many_to_txt_file([bill_text])
+
+    def append_many_to_txt_file(self, chunks: list) -> None:
+        """
+        Append several formatted bill texts to the .txt file with a single open.
+        Lines are streamed through the file buffer instead of joined into one string.
 
-            with open(self.output_file, 'a', encoding='utf-8') as f:
-                f.write(bill_text + '\n')
-            LOG.info(f"Successfully appended bill to {self.output_file}")
+        Args:
+            chunks: Formatted bill texts to append, one per line
+        """
+        try:
+            with open(self.output_file, 'a', encoding='utf-8', buffering=1 << 16) as f:
+                f.writelines(f"{chunk}\n" for chunk in chunks)
+            LOG.info("Successfully appended %s entries to %s", len(chunks), self.output_file)
         except Exception as e:
-            LOG.error(f"Failed to write to {self.output_file}: {e}")
+            LOG.error("Failed to write to %s: %s", self.output_file, e)
             raise
 
     def store_in_database(self, bill_data: Dict[str, Any]) -> bool:
@@ -92,44 +144,174 @@ class XPoster:
             bill_number = bill_data.get('bill_number', '')
             bill_type = bill_data.get('bill_type', '')
             congress = bill_data.get('congress', '')
-            formatted_number = bill_data.get('formatted_bill_number', f"{bill_type}.{bill_number}")
+            formatted_number = bill_data.get('formatted_bill_number') or f"{bill_type}.{bill_number}"
 
             # Check if bill already exists in database
             try:
                 conn = init_db_connection()
-                if bill_exists(conn, congress, bill_number, bill_type):
-                    LOG.warning(f"⚠️  Bill {formatted_number} already exists in database - skipping to prevent duplicate posting")
+                try:
+                    if bill_exists(conn, congress, bill_number, bill_type):
+                        LOG.warning("⚠️  Bill %s already exists in database - skipping to prevent duplicate posting", formatted_number)
+                        return False
+                finally:
                     conn.close()
-                    return False
-                conn.close()
             except Exception as e:
-                LOG.error(f"❌ Database validation check failed for {formatted_number}: {e}")
+                LOG.error("❌ Database validation check failed for %s: %s", formatted_number, e)
                 raise
 
-            # Prepare data for database logging
-            db_data = {
-                'bill_number': bill_number,
-                'bill_type': bill_type,
-                'congress': congress,
-                'title': bill_data.get('title', 'Unknown'),
-                'summary': bill_data.get('summary', 'Unknown'),
-                'sponsor': bill_data.get('sponsor', 'Unknown'),
-                'introduced_date': bill_data.get('introduced_date', 'Unknown'),
-                'status': 'Introduced',
-                'url': bill_data.get('url', 'Unknown')
-            }
-
-            log_bill_from_data(db_data)
-            LOG.info(f"✅ Successfully stored bill {formatted_number} in database")
+            log_bill_from_data(self._build_db_data(bill_data))
+            LOG.info("✅ Successfully stored bill %s in database", formatted_number)
             return True
 
         except Exception as e:
-            LOG.error(f"Failed to store bill in database: {e}")
+            LOG.error("Failed to store bill in database: %s", e)
             raise
 
+    def _build_db_data(self, bill_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Prepare bill data for database logging.
+
+        Args:
+            bill_data: Bill data dictionary
+
+        Returns:
+            Dictionary in the format expected by log_bill_from_data
+        """
+        return {
+            'bill_number': bill_data.get('bill_number', ''),
+            'bill_type': bill_data.get('bill_type', ''),
+            'congress': bill_data.get('congress', ''),
+            'title': bill_data.get('title', 'Unknown'),
+            'summary': bill_data.get('summary', 'Unknown'),
+            'sponsor': bill_data.get('sponsor', 'Unknown'),
+            'introduced_date': bill_data.get('introduced_date', 'Unknown'),
+            'status': 'Introduced',
+            'url': bill_data.get('url', 'Unknown')
+        }
+
+    def store_bills_in_database(self, bills: list) -> set:
+        """
+        Store a batch of bills, checking for existing bills with a single query.
+        Bill keys are loaded into a temp table and joined against the bills table
+        once, instead of issuing a bill_exists query per bill.
+
+        Args:
+            bills: List of bill data dictionaries
+
+        Returns:
+            Set of formatted bill numbers that already existed in the database
+        """
+        keys = [(str(bill.get('congress', '')), str(bill.get('bill_number', '')), str(bill.get('bill_type', ''))) for bill in bills]
+
+        # Find bills already in the database (temp table is dropped when the batch connection closes)
+        try:
+            with closing(init_db_connection()) as conn:
+                conn.execute("CREATE TEMP TABLE tmp_bills (congress, bill_number, bill_type, PRIMARY KEY (congress, bill_number, bill_type)) WITHOUT ROWID")
+                conn.executemany("INSERT OR IGNORE INTO tmp_bills VALUES (?, ?, ?)", keys)
+                existing_keys = set(conn.execute("""
+                    SELECT t.congress, t.bill_number, t.bill_type
+                    FROM tmp_bills t
+                    JOIN bills b
+                      ON b.congress_id = t.congress AND b.Bill_Number = t.bill_number AND b.Bill_Type = t.bill_type
+                """).fetchall())
+        except Exception as e:
+            LOG.error("❌ Database validation check failed for batch of %s bills: %s", len(bills), e)
+            return set()
+
+        duplicates = set()
+        bills_saved = 0
+        for bill_data, key in zip(bills, keys):
+            formatted_number = bill_data.get('formatted_bill_number') or f"{key[2]}.{key[1]}"
+            if key in existing_keys:
+                duplicates.add(formatted_number)
+                continue
+            if self._try_store(bill_data, formatted_number):
+                bills_saved += 1
+
+        LOG.info("Successfully saved %s out of %s bills to database", bills_saved, len(bills))
+        return duplicates
+
+    def _try_store(self, bill_data: Dict[str, Any], formatted_number: str) -> bool:
+        """
+        Insert one bill, logging (not raising) a failure so a batch can continue.
+
+        Args:
+            bill_data: Bill data dictionary
+            formatted_number: Bill identifier used in the log message
+
+        Returns:
+            True if the bill was stored, False otherwise
+        """
+        try:
+            log_bill_from_data(self._build_db_data(bill_data))
+            return True
+        except Exception as e:
+            LOG.error("Failed to store bill %s in database: %s", formatted_number, e)
+            return False
+
+    def _upload_one(self, api, image_path: str, alt_text: Optional[str] = None) -> Optional[str]:
+        """
+        Upload a single image to X.com, optionally attaching alt text.
+
+        Args:
+            api: Tweepy v1.1 API object used for media uploads
+            image_path: Path to the image file
+            alt_text: Optional alt text for accessibility
+
+        Returns:
+            Media ID as a string (for the v2 API), or None if the upload failed
+        """
+        # One stat catches missing, empty and oversized files before spending an HTTP round-trip
+        try:
+            size = os.stat(image_path).st_size
+        except OSError as e:
+            LOG.warning("Failed to upload image %s: %s", image_path, e)
+            return None
+        if not 0 < size <= MAX_IMAGE_UPLOAD_BYTES:
+            LOG.warning("Failed to upload image %s: file size %s bytes is outside X.com's limit", image_path, size)
+            return None
+
+        try:
+            LOG.info("Uploading image: %s", image_path)
+            # Use Tweepy API v1.1 method for media uploads
+            media = api.media_upload(image_path)
+            if alt_text:
+                try:
+                    api.create_media_metadata(media_id=media.media_id, alt_text=alt_text)
+                    LOG.info("✅ Uploaded image - Media ID: %s with alt text", media.media_id)
+                except AttributeError:
+                    LOG.warning("⚠️  Alt text method not available for media %s, proceeding without alt text", media.media_id)
+                    LOG.info("✅ Uploaded image - Media ID: %s", media.media_id)
+            else:
+                LOG.info("✅ Uploaded image - Media ID: %s", media.media_id)
+            return str(media.media_id)  # Convert to string for v2 API
+        except Exception as e:
+            LOG.warning("Failed to upload image %s: %s", image_path, e)
+            return None
 
+    def _upload_images(self, api, image_paths: list, alt_texts: Optional[list] = None) -> list:
+        """
+        Upload images concurrently; uploads are network-bound so threads overlap them.
 
+        Args:
+            api: Tweepy v1.1 API object used for media uploads
+            image_paths: List of image file paths
+            alt_texts: Optional list of alt texts, one per image
 
+        Returns:
+            List of media IDs in the same order as image_paths (None for failed uploads)
+        """
+        if not image_paths:
+            return []
+        alt_texts = alt_texts or [None] * len(image_paths)
+        with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(image_paths))) as executor:
+            media_ids = list(executor.map(lambda args: self._upload_one(api, *args), zip(image_paths, alt_texts)))
+
+        # One summary line for the whole batch
+        failed = [path for path, media_id in zip(image_paths, media_ids) if media_id is None]
+        if failed:
+            LOG.warning("⚠️  %s of %s image upload(s) failed: %s", len(failed), len(image_paths), ", ".join(failed))
+        return media_ids
 
     def process_bill(self, bill_data: Dict[str, Any]) -> bool:
         """
@@ -141,8 +323,9 @@ class XPoster:
         Returns:
             True if successful, False otherwise
         """
+        bid = bill_data.get('formatted_bill_number', 'Unknown')
         try:
-            LOG.info(f"Processing bill: {bill_data.get('formatted_bill_number', 'Unknown')}")
+            LOG.info("Processing bill: %s", bid)
 
             # Format the bill text
             bill_text = self.format_bill_text(bill_data)
@@ -153,11 +336,11 @@ class XPoster:
             # Then store in database
             self.store_in_database(bill_data)
 
-            LOG.info(f"Successfully processed bill: {bill_data.get('formatted_bill_number', 'Unknown')}")
+            LOG.info("Successfully processed bill: %s", bid)
             return True
 
         except Exception as e:
-            LOG.error(f"Failed to process bill {bill_data.get('formatted_bill_number', 'Unknown')}: {e}")
+            LOG.error("Failed to process bill %s: %s", bid, e)
             return False
 
     def process_bills_into_posts(self, bills_data: list, post_to_x: bool = False, create_png: bool = False, png_filename: str = "federal_bills_summary.png") -> tuple[int, bool]:
@@ -176,34 +359,23 @@ class XPoster:
         """
         try:
             # Deduplicate bills by formatted_bill_number to prevent duplicates in posts and images
-            seen_bills = {}
-            deduplicated_bills = []
-            for bill in bills_data:
-                bill_id = bill.get('formatted_bill_number', '')
-                if bill_id and bill_id not in seen_bills:
-                    seen_bills[bill_id] = True
-                    deduplicated_bills.append(bill)
-                elif not bill_id:
-                    deduplicated_bills.append(bill)
-
-            if len(deduplicated_bills) < len(bills_data):
-                LOG.warning(f"Deduplicated bills: {len(bills_data)} -> {len(deduplicated_bills)} (removed {len(bills_data) - len(deduplicated_bills)} duplicates)")
+            deduplicated_bills = dedupe_by_bill_number(bills_data)
 
+            original_count = len(bills_data)
             bills_data = deduplicated_bills
+            bill_count = len(bills_data)
+            if bill_count < original_count:
+                LOG.warning("Deduplicated bills: %s -> %s (removed %s duplicates)", original_count, bill_count, original_count - bill_count)
 
-            LOG.info(f"Processing {len(bills_data)} bills - posting as ONE tweet with images")
-
-            # Format all bills
-            formatted_bills = []
-            for bill_data in bills_data:
-                formatted_text = self.format_bill_text(bill_data)
-                formatted_bills.append((bill_data, formatted_text))
+            if bill_count == 0:
+                LOG.info("No bills to post after dedup; skipping")
+                return 0, False
 
-            # Create single post text with all bills
-            post_text = "\n".join([bill_text for _, bill_text in formatted_bills])
+            LOG.info("Processing %s bills - posting as ONE tweet with images", bill_count)
 
-            # Write to .txt file
-            self.append_to_txt_file(post_text, add_new_post_indicator=False)
+            # Format all bills and write them to the .txt file in one batched write
+            format_bill_text = self.format_bill_text
+            self.append_many_to_txt_file([format_bill_text(bill_data) for bill_data in bills_data])
 
             # Create PNG images if requested
             image_paths = []
@@ -212,7 +384,7 @@ class XPoster:
                 image_paths = self.image_generator.create_multiple_bills_pngs(bills_data, png_filename)
 
                 if image_paths:
-                    LOG.info(f"Successfully created {len(image_paths)} PNG image(s)")
+                    LOG.info("Successfully created %s PNG image(s)", len(image_paths))
                 else:
                     LOG.error("Failed to create PNG images")
 
@@ -220,87 +392,53 @@ class XPoster:
             posted_count = 0
             if post_to_x:
                 try:
-                    from ..api.x_api_call import get_x_api_client, get_x_api
-                except ImportError:
-                    from pathlib import Path
-                    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-                    from api.x_api_call import get_x_api_client, get_x_api
+                    client, api = _get_x_clients()  # v2 Client for posting, v1.1 API for media uploads
 
-                try:
-                    client = get_x_api_client()  # v2 API Client for posting
-                    api = get_x_api()  # v1.1 API for media uploads (has limited access)
-
-                    # Upload all images and collect media IDs using v1.1 API
-                    media_ids = []
-                    for idx, image_path in enumerate(image_paths):
-                        try:
-                            LOG.info(f"Uploading image: {image_path}")
-                            # Use Tweepy API v1.1 method for media uploads
-                            media = api.media_upload(image_path)
-                            # Add alt text for accessibility
-                            alt_text = f"Bill summary image - Part {idx+1} of {len(image_paths)}"
-                            try:
-                                api.create_media_metadata(media_id=media.media_id, alt_text=alt_text)
-                                LOG.info(f"✅ Uploaded image - Media ID: {media.media_id} with alt text")
-                            except AttributeError:
-                                LOG.warning(f"⚠️  Alt text method not available for media {media.media_id}, proceeding without alt text")
-                                LOG.info(f"✅ Uploaded image - Media ID: {media.media_id}")
-                            media_ids.append(str(media.media_id))  # Convert to string for v2 API
-                        except Exception as e:
-                            LOG.warning(f"Failed to upload image {image_path}: {e}")
+                    # Upload all images concurrently and collect media IDs using v1.1 API
+                    image_count = len(image_paths)
+                    alt_texts = [f"Bill summary image - Part {idx} of {image_count}" for idx in range(1, image_count + 1)]
+                    media_ids = [media_id for media_id in self._upload_images(api, image_paths, alt_texts) if media_id]
 
                     # Post single tweet with all images using v2 API (has broader endpoint access)
                     try:
-                        # Generate timestamp in EST
-                        est_tz = timezone(timedelta(hours=-5))  # EST is UTC-5
-                        est_time = datetime.now(est_tz)
-                        date_str = est_time.strftime('%Y-%m-%d')
-                        time_str = est_time.strftime('%I:%M %p')
+                        # Generate date in Eastern time
+                        date_str, _ = now_est_strings()
 
                         # Create proper tweet text summary (NOT the raw bill list)
-                        bill_count = len(bills_data)
-                        tweet_text = f"🚨 NOTICE: Congress Unviels New Bills ({date_str}, {bill_count} identified)! View key details in the Attached Images or directly at https://www.congress.gov/bills-with-chamber-action/browse-by-date📄."
-
-                        # Ensure tweet is within 280 character limit
-                        if len(tweet_text) > 280:
-                            tweet_text = tweet_text[:277] + "..."
+                        tweet_text = BILLS_TWEET_TEMPLATE.format(date=date_str, count=bill_count)
 
+                        # Create tweet using v2 API (broader access), attaching media only when there is some
+                        tweet_kwargs = {'text': tweet_text}
                         if media_ids:
-                            # Create tweet with media IDs using v2 API (broader access)
-                            response = client.create_tweet(text=tweet_text, media_ids=media_ids)
-                            tweet_id = response.data['id']
-                            LOG.info(f"✅ Posted tweet with {len(media_ids)} images to X.com - Tweet ID: {tweet_id}")
-                            posted_count = 1
+                            tweet_kwargs['media_ids'] = media_ids
+                        response = client.create_tweet(**tweet_kwargs)
+                        tweet_id = response.data['id']
+                        if media_ids:
+                            LOG.info("✅ Posted tweet with %s images to X.com - Tweet ID: %s", len(media_ids), tweet_id)
                         else:
-                            # Create tweet without media using v2 API
-                            response = client.create_tweet(text=tweet_text)
-                            tweet_id = response.data['id']
-                            LOG.info(f"✅ Posted tweet (no images) to X.com - Tweet ID: {tweet_id}")
-                            posted_count = 1
+                            LOG.info("✅ Posted tweet (no images) to X.com - Tweet ID: %s", tweet_id)
+                        posted_count = 1
 
                     except Exception as e:
-                        LOG.error(f"Failed to post tweet: {e}")
+                        LOG.error("Failed to post tweet: %s", e)
                         posted_count = 0
 
                 except Exception as e:
-                    LOG.error(f"Failed to initialize X API client: {e}")
+                    LOG.error("Failed to initialize X API client: %s", e)
                     posted_count = 0
             else:
                 LOG.info("X posting disabled - bills written to .txt file only")
                 posted_count = 0
 
-            # Store all bills in database
-            LOG.info("Saving bills to database...")
-            bills_saved = 0
-            for bill_data, _ in formatted_bills:
-                try:
-                    was_stored = self.store_in_database(bill_data)
-                    if was_stored:
-                        bills_saved += 1
-                except Exception as e:
-                    LOG.error(f"Failed to store bill {bill_data.get('formatted_bill_number', 'Unknown')} in database: {e}")
-
-            LOG.info(f"Successfully saved {bills_saved} out of {len(formatted_bills)} bills to database")
+            # Store all bills in database; a dry run (no images, no posting) skips this unless
+            # persist_on_dry_run is set, so later real runs do not treat the bills as already posted
+            if post_to_x or create_png or self.persist_on_dry_run:
+                LOG.info("Saving bills to database...")
+                duplicates = self.store_bills_in_database(bills_data)
+                for formatted_number in sorted(duplicates):
+                    LOG.warning("⚠️  Bill %s already exists in database - skipping to prevent duplicate posting", formatted_number)
+            else:
+                LOG.info("Dry run - bills not saved to database")
 
             # Return result tuple
             posting_successful = posted_count > 0 if post_to_x else False
@@ -316,11 +454,11 @@ class XPoster:
             elif image_paths and not post_to_x:
                 LOG.info("Images not archived (X posting disabled)")
 
-            LOG.info(f"Processing complete - {len(bills_data)} bills in ONE tweet, {len(image_paths)} images. X posting success: {posting_successful}")
-            return len(bills_data), posting_successful
+            LOG.info("Processing complete - %s bills in ONE tweet, %s images. X posting success: %s", bill_count, len(image_paths), posting_successful)
+            return bill_count, posting_successful
 
         except Exception as e:
-            LOG.error(f"Failed to process bills into posts: {e}")
+            LOG.error("Failed to process bills into posts: %s", e)
             return 0, False
 
     def post_all_images_sequentially(self, bills_data: list, create_png: bool = True, png_filename: str = "federal_bills_summary.png") -> tuple[int, int]:
@@ -339,27 +477,19 @@ class XPoster:
         """
         try:
             # Deduplicate bills by formatted_bill_number to prevent duplicates
-            seen_bills = {}
-            deduplicated_bills = []
-            for bill in bills_data:
-                bill_id = bill.get('formatted_bill_number', '')
-                if bill_id and bill_id not in seen_bills:
-                    seen_bills[bill_id] = True
-                    deduplicated_bills.append(bill)
-                elif not bill_id:
-                    deduplicated_bills.append(bill)
-
-            if len(deduplicated_bills) < len(bills_data):
-                LOG.warning(f"Deduplicated bills: {len(bills_data)} -> {len(deduplicated_bills)} (removed {len(bills_data) - len(deduplicated_bills)} duplicates)")
+            deduplicated_bills = dedupe_by_bill_number(bills_data)
 
+            original_count = len(bills_data)
             bills_data = deduplicated_bills
             total_bills = len(bills_data)
+            if total_bills < original_count:
+                LOG.warning("Deduplicated bills: %s -> %s (removed %s duplicates)", original_count, total_bills, original_count - total_bills)
             
             if total_bills == 0:
                 LOG.warning("No bills to process")
                 return 0, 0
 
-            LOG.info(f"Starting sequential posting for {total_bills} bills (10 bills per image, up to 4 images per tweet)...")
+            LOG.info("Starting sequential posting for %s bills (10 bills per image, up to 4 images per tweet)...", total_bills)
 
             # Create PNG images
             image_paths = []
@@ -369,99 +499,72 @@ class XPoster:
                 if not image_paths:
                     LOG.error("Failed to create PNG images")
                     return total_bills, 0
-                LOG.info(f"Successfully created {len(image_paths)} PNG image(s)")
+                LOG.info("Successfully created %s PNG image(s)", len(image_paths))
             else:
                 LOG.warning("PNG creation disabled - no images to post")
                 return total_bills, 0
 
             # Initialize X API
             try:
-                from ..api.x_api_call import get_x_api_client, get_x_api
-            except ImportError:
-                from pathlib import Path
-                import sys
-                sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-                from api.x_api_call import get_x_api_client, get_x_api
-
-            try:
-                client = get_x_api_client()  # v2 API Client for posting
-                api = get_x_api()  # v1.1 API for media uploads
+                client, api = _get_x_clients()  # v2 Client for posting, v1.1 API for media uploads
             except Exception as e:
-                LOG.error(f"Failed to initialize X API client: {e}")
+                LOG.error("Failed to initialize X API client: %s", e)
                 return total_bills, 0
 
             # Group images into chunks of 4 (X.com supports up to 4 media per tweet)
             max_images_per_tweet = 4
             tweets_posted = 0
             total_images = len(image_paths)
+            total_chunks = (total_images + max_images_per_tweet - 1) // max_images_per_tweet
+
+            # Generate timestamp in Eastern time once for the whole batch of tweets
+            date_str, time_str = now_est_strings()
+
+            # Fill in the loop-invariant tweet fields once; only the tweet number changes per tweet
+            if total_chunks > 1:
+                tweet_template = SEQUENCE_TWEET_TEMPLATE.format(date=date_str, time=time_str, num="{num}", total=total_chunks)
+            else:
+                tweet_template = SINGLE_TWEET_TEMPLATE.format(date=date_str, time=time_str, images=total_images)
+
+            # Uploads do not depend on earlier tweets, so upload every image up front in one
+            # concurrent batch; later tweets' uploads then overlap earlier ones instead of waiting
+            all_media_ids = self._upload_images(api, image_paths)
 
             for tweet_idx in range(0, total_images, max_images_per_tweet):
                 try:
                     image_chunk = image_paths[tweet_idx:tweet_idx + max_images_per_tweet]
                     chunk_num = (tweet_idx // max_images_per_tweet) + 1
-                    total_chunks = (total_images + max_images_per_tweet - 1) // max_images_per_tweet
-
-                    LOG.info(f"Processing tweet {chunk_num}/{total_chunks} with {len(image_chunk)} image(s)...")
-
-                    # Upload all images in this chunk
-                    media_ids = []
-                    for image_idx, image_path in enumerate(image_chunk, 1):
-                        try:
-                            LOG.info(f"Uploading image {tweet_idx + image_idx}/{total_images}: {image_path}")
-                            media = api.media_upload(image_path)
-                            media_ids.append(str(media.media_id))
-                            LOG.info(f"✅ Uploaded image - Media ID: {media.media_id}")
-                        except Exception as e:
-                            LOG.warning(f"Failed to upload image {image_path}: {e}")
-                            continue
+
+                    LOG.info("Processing tweet %s/%s with %s image(s)...", chunk_num, total_chunks, len(image_chunk))
+
+                    media_ids = [media_id for media_id in all_media_ids[tweet_idx:tweet_idx + max_images_per_tweet] if media_id]
 
                     if not media_ids:
-                        LOG.warning(f"No media IDs for tweet {chunk_num}, skipping...")
+                        LOG.warning("No media IDs for tweet %s, skipping...", chunk_num)
                         continue
 
-                    # Generate timestamp in EST
-                    est_tz = timezone(timedelta(hours=-5))  # EST is UTC-5
-                    est_time = datetime.now(est_tz)
-                    date_str = est_time.strftime('%Y-%m-%d')
-                    time_str = est_time.strftime('%I:%M %p')
-
                     # Create tweet text for this batch of images
-                    images_shown = sum(10 for _ in image_chunk)  # Approximate bills shown
-                    if total_chunks > 1:
-                        tweet_text = f"Introduced Legislation - {date_str} {time_str} EST. Tweet {chunk_num} of {total_chunks}. See images for bill details or visit https://tinyurl.com/recentbills"
-                    else:
-                        tweet_text = f"Introduced Legislation - {date_str} {time_str} EST. {total_images} image(s) with bill details. Visit https://tinyurl.com/recentbills"
-
-                    # Ensure tweet is within 280 character limit
-                    if len(tweet_text) > 280:
-                        tweet_text = tweet_text[:277] + "..."
+                    tweet_text = tweet_template.format(num=chunk_num)
 
                     # Post tweet with images
                     try:
                         response = client.create_tweet(text=tweet_text, media_ids=media_ids)
                         tweet_id = response.data['id']
-                        LOG.info(f"✅ Posted tweet {chunk_num}/{total_chunks} with {len(media_ids)} image(s) to X.com - Tweet ID: {tweet_id}")
+                        LOG.info("✅ Posted tweet %s/%s with %s image(s) to X.com - Tweet ID: %s", chunk_num, total_chunks, len(media_ids), tweet_id)
                         tweets_posted += 1
                     except Exception as e:
-                        LOG.error(f"Failed to post tweet {chunk_num}: {e}")
+                        LOG.error("Failed to post tweet %s: %s", chunk_num, e)
                         continue
 
                 except Exception as e:
-                    LOG.error(f"Error processing tweet {chunk_num}: {e}")
+                    LOG.error("Error processing tweet %s: %s", chunk_num, e)
                     continue
 
             # Store all bills in database
             LOG.info("Saving bills to database...")
-            bills_saved = 0
-            for bill_data in bills_data:
-                try:
-                    was_stored = self.store_in_database(bill_data)
-                    if was_stored:
-                        bills_saved += 1
-                except Exception as e:
-                    LOG.error(f"Failed to store bill {bill_data.get('formatted_bill_number', 'Unknown')} in database: {e}")
-
-            LOG.info(f"Successfully saved {bills_saved} out of {total_bills} bills to database")
+            duplicates = self.store_bills_in_database(bills_data)
+            for formatted_number in sorted(duplicates):
+                LOG.warning("⚠️  Bill %s already exists in database - skipping to prevent duplicate posting", formatted_number)
 
             # Archive images after successful posting
             if tweets_posted > 0 and image_paths:
@@ -472,9 +575,9 @@ class XPoster:
                 else:
                     LOG.warning("⚠️  Some images may not have been archived")
 
-            LOG.info(f"Sequential posting complete - {total_bills} bills, {total_images} images, {tweets_posted} tweets posted successfully")
+            LOG.info("Sequential posting complete - %s bills, %s images, %s tweets posted successfully", total_bills, total_images, tweets_posted)
             return total_bills, tweets_posted
 
         except Exception as e:
-            LOG.error(f"Failed to post images sequentially: {e}")
+            LOG.error("Failed to post images sequentially: %s", e)
             return 0, 0
\ No newline at end of file